@@ -113,11 +113,17 @@ const parseCSVData = () => {
 
 // Calculate summary data from CSV data
 const calculateSummary = (assets) => {
+  // Count every status in a single pass instead of one filter per status
+  const statusCounts = {};
+  assets.forEach(asset => {
+    statusCounts[asset.status] = (statusCounts[asset.status] || 0) + 1;
+  });
+
   const totalAssets = assets.length;
-  const currentlyRented = assets.filter(asset => asset.status === 'Rented').length;
-  const available = assets.filter(asset => asset.status === 'Available').length;
-  const overdue = assets.filter(asset => asset.status === 'Overdue').length;
-  const underMaintenance = assets.filter(asset => asset.status === 'Under Maintenance').length;
+  const currentlyRented = statusCounts['Rented'] || 0;
+  const available = statusCounts['Available'] || 0;
+  const overdue = statusCounts['Overdue'] || 0;
+  const underMaintenance = statusCounts['Under Maintenance'] || 0;
 
   return {
     totalAssets,